@@ -0,0 +1,135 @@
+/*
+ * Native CPU core for emu.py, loaded through ctypes when present.
+ *
+ * Build next to emu.py:
+ *   Linux:   cc -O2 -shared -fPIC -o cpu6502.so cpu6502.c
+ *   macOS:   cc -O2 -shared -fPIC -o cpu6502.dylib cpu6502.c
+ *   Windows: cl /O2 /LD cpu6502.c
+ *
+ * regs layout matches REG_NAMES in emu.py: A, X, Y, PC, SP, P.
+ * status bits match STATUS_HALTED in emu.py.
+ */
+#include <stdint.h>
+
+#ifdef _WIN32
+#define EXPORT __declspec(dllexport)
+#else
+#define EXPORT
+#endif
+
+enum { REG_A, REG_X, REG_Y, REG_PC, REG_SP, REG_P };
+enum { STATUS_HALTED = 0x01 };
+
+/* Zero and Negative flag bits for every 8-bit result */
+static const uint8_t zn_table[256] = {
+    0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
+    0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
+    0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
+    0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
+    0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
+    0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
+    0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
+    0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
+};
+
+/*
+ * GCC and Clang get direct-threaded dispatch: every handler ends with its
+ * own indirect jump through dispatch_table, so each opcode has a separate
+ * branch history. Other compilers fall back to a switch in a loop.
+ */
+#if defined(__GNUC__) || defined(__clang__)
+#define THREADED_DISPATCH 1
+#endif
+
+#ifdef THREADED_DISPATCH
+#define OP(n) op_##n:
+#define OP_UNKNOWN op_unknown:
+#define NEXT() if (cycles >= target) goto done; goto *dispatch_table[mem[PC++]]
+#else
+#define OP(n) case 0x##n:
+#define OP_UNKNOWN default:
+#define NEXT() break
+#endif
+
+#define SET_ZN(v) (P = (uint8_t)((P & 0x7D) | zn_table[v]))
+#define FETCH_WORD() (addr = (uint16_t)(mem[PC] | (mem[(uint16_t)(PC + 1)] << 8)), PC += 2)
+
+/* Run until at least target cycles have elapsed or BRK is hit. */
+EXPORT uint32_t snes_run(uint8_t *mem, uint16_t *regs, uint32_t target, uint8_t *status)
+{
+    uint16_t PC = regs[REG_PC];
+    uint8_t A = (uint8_t)regs[REG_A];
+    uint8_t P = (uint8_t)regs[REG_P];
+    uint16_t addr;
+    uint32_t cycles = 0;
+    uint8_t flags = 0;
+
+#ifdef THREADED_DISPATCH
+    static void *dispatch_table[256];
+    if (!dispatch_table[0]) {
+        for (int i = 0; i < 256; i++)
+            dispatch_table[i] = &&op_unknown;
+        dispatch_table[0xA9] = &&op_A9;
+        dispatch_table[0xAD] = &&op_AD;
+        dispatch_table[0x8D] = &&op_8D;
+        dispatch_table[0x4C] = &&op_4C;
+        dispatch_table[0xEA] = &&op_EA;
+        dispatch_table[0x00] = &&op_00;
+    }
+    NEXT();
+#else
+    while (cycles < target) {
+        switch (mem[PC++]) {
+#endif
+
+    OP(A9) /* LDA immediate */
+        A = mem[PC++];
+        SET_ZN(A);
+        cycles += 2;
+        NEXT();
+    OP(AD) /* LDA absolute */
+        FETCH_WORD();
+        A = mem[addr];
+        SET_ZN(A);
+        cycles += 4;
+        NEXT();
+    OP(8D) /* STA absolute */
+        FETCH_WORD();
+        mem[addr] = A;
+        cycles += 4;
+        NEXT();
+    OP(4C) /* JMP absolute */
+        FETCH_WORD();
+        PC = addr;
+        cycles += 3;
+        NEXT();
+    OP(EA) /* NOP */
+        cycles += 2;
+        NEXT();
+    OP(00) /* BRK */
+        cycles += 7;
+        flags |= STATUS_HALTED;
+        goto done;
+    OP_UNKNOWN /* Unknown opcode */
+        NEXT();
+
+#ifndef THREADED_DISPATCH
+        }
+    }
+#endif
+
+done:
+    regs[REG_A] = A;
+    regs[REG_PC] = PC;
+    regs[REG_P] = P;
+    *status = flags;
+    return cycles;
+}
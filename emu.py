@@ -2,11 +2,136 @@ import tkinter as tk
 import time
 import struct
 import os
+import base64
+import ctypes
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Register layout shared by the compiled CPU loop
+REG_NAMES = ('A', 'X', 'Y', 'PC', 'SP', 'P')
+REG_A, REG_X, REG_Y, REG_PC, REG_SP, REG_P = range(6)
+
+# Status bits reported by the compiled CPU loops
+STATUS_HALTED = 0x01
+
+# Little-endian 16-bit word in memory
+WORD = struct.Struct('<H')
+
+# Zero and Negative flag bits for every 8-bit result
+ZN_TABLE = bytes((0x02 if v == 0 else 0) | (v & 0x80) for v in range(256))
+ZN_TABLE_NP = np.frombuffer(ZN_TABLE, dtype=np.uint8)
+
+# Longest straight-line run translated into a single block
+MAX_BLOCK_INSTRUCTIONS = 64
+
+# Test environment, built once at import
+# Simple tile pattern in the first row of all 256 tiles
+TEST_TILES = bytes([0xAA, 0x55] + [0] * 14) * 256  # 10101010, 01010101
+TEST_TILEMAP = bytes((x + y) % 256 for y in range(28) for x in range(32))
+TEST_PROGRAM = bytes([
+    0xA9, 0x01,        # LDA #$01
+    0x8D, 0x00, 0x20,   # STA $2000 (PPU Control)
+    0xA9, 0x3F,         # LDA #$3F
+    0x8D, 0x06, 0x20,   # STA $2006 (PPU Addr High)
+    0xA9, 0x00,         # LDA #$00
+    0x8D, 0x06, 0x20,   # STA $2006 (PPU Addr Low)
+    0x4C, 0x00, 0x80    # JMP $8000 (Loop)
+])
+
+if numba is not None:
+    jit = numba.njit(cache=True)
+else:
+    def jit(func):
+        return func
+
+@jit
+def run_cpu(mem, regs, target):
+    # Same instruction set as the CPU class, on flat arrays so Numba can
+    # compile the whole dispatch loop. Returns (cycles, status).
+    pc = np.int64(regs[REG_PC])
+    a = np.int64(regs[REG_A])
+    p = np.int64(regs[REG_P])
+    cycles = 0
+    status = 0
+    while cycles < target:
+        op = mem[pc]
+        pc = (pc + 1) & 0xFFFF
+        if op == 0xA9:  # LDA immediate
+            a = np.int64(mem[pc])
+            pc = (pc + 1) & 0xFFFF
+            p = (p & 0x7D) | ZN_TABLE_NP[a]
+            cycles += 2
+        elif op == 0xAD:  # LDA absolute
+            addr = np.int64(mem[pc]) | (np.int64(mem[(pc + 1) & 0xFFFF]) << 8)
+            pc = (pc + 2) & 0xFFFF
+            a = np.int64(mem[addr])
+            p = (p & 0x7D) | ZN_TABLE_NP[a]
+            cycles += 4
+        elif op == 0x8D:  # STA absolute
+            addr = np.int64(mem[pc]) | (np.int64(mem[(pc + 1) & 0xFFFF]) << 8)
+            pc = (pc + 2) & 0xFFFF
+            mem[addr] = a
+            cycles += 4
+        elif op == 0x4C:  # JMP absolute
+            pc = np.int64(mem[pc]) | (np.int64(mem[(pc + 1) & 0xFFFF]) << 8)
+            cycles += 3
+        elif op == 0xEA:  # NOP
+            cycles += 2
+        elif op == 0x00:  # BRK
+            cycles += 7
+            status |= STATUS_HALTED
+            break
+    regs[REG_PC] = pc
+    regs[REG_A] = a
+    regs[REG_P] = p
+    return cycles, status
+
+def load_native_cpu():
+    # Optional C core built from cpu6502.c next to this file
+    base = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cpu6502")
+    for ext in (".so", ".dylib", ".dll"):
+        path = base + ext
+        if not os.path.exists(path):
+            continue
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError:
+            continue
+        snes_run = lib.snes_run
+        snes_run.argtypes = [
+            ctypes.POINTER(ctypes.c_uint8),
+            ctypes.POINTER(ctypes.c_uint16),
+            ctypes.c_uint32,
+            ctypes.POINTER(ctypes.c_uint8),
+        ]
+        snes_run.restype = ctypes.c_uint32
+        return snes_run
+    return None
+
+snes_run = load_native_cpu()
 
 class CPU:
     def __init__(self):
-        self.registers = {'A': 0, 'X': 0, 'Y': 0, 'PC': 0x8000, 'SP': 0x1FF, 'P': 0}
+        self.A = 0
+        self.X = 0
+        self.Y = 0
+        self.PC = 0x8000
+        self.SP = 0x1FF
+        self.P = 0
         self.memory = bytearray(0x10000)
+        self.mem_np = np.frombuffer(self.memory, dtype=np.uint8)
+        # Shares storage with memory, for passing to the C core
+        self.memory_c = (ctypes.c_uint8 * len(self.memory)).from_buffer(self.memory)
+        # uint16 register file for the compiled loops, shared with ctypes
+        self.regs = np.zeros(len(REG_NAMES), dtype=np.uint16)
+        self.regs_c = (ctypes.c_uint16 * len(REG_NAMES)).from_buffer(self.regs)
+        self._pack_word = WORD.pack_into
+        self._unpack_word = WORD.unpack_from
         self.clock_cycles = 0
         self.opcodes = {
             0xA9: self.LDA_immediate,
@@ -16,61 +141,78 @@ class CPU:
             0xEA: self.NOP,
             0x00: self.BRK
         }
+        # Flat dispatch table indexed directly by opcode
+        self.opcode_table = [self._unknown] * 256
+        for opcode, handler in self.opcodes.items():
+            self.opcode_table[opcode] = handler
+        # Translated basic blocks keyed by start address, and a map of the
+        # bytes they were translated from so stores into them can flush
+        self.block_cache = {}
+        self.code_map = bytearray(0x10000)
         self.running = True
         
+    @property
+    def registers(self):
+        # Snapshot for the debugger views
+        return {name: getattr(self, name) for name in REG_NAMES}
+        
     def reset(self):
-        self.registers['PC'] = self.read_word(0xFFFC)
+        self.PC = self.read_word(0xFFFC)
         
     def fetch_byte(self):
-        value = self.memory[self.registers['PC']]
-        self.registers['PC'] += 1
+        value = self.memory[self.PC]
+        self.PC = (self.PC + 1) & 0xFFFF
+        return value
+        
+    def fetch_word(self):
+        pc = self.PC
+        if pc != 0xFFFF:
+            value = self._unpack_word(self.memory, pc)[0]
+        else:
+            value = self.memory[0xFFFF] | (self.memory[0] << 8)
+        self.PC = (pc + 2) & 0xFFFF
         return value
         
     def read_byte(self, address):
         return self.memory[address]
     
     def read_word(self, address):
-        lo = self.memory[address]
-        hi = self.memory[address + 1]
-        return (hi << 8) | lo
+        return self._unpack_word(self.memory, address)[0]
         
     def write_byte(self, address, value):
         self.memory[address] = value & 0xFF
+        if self.code_map[address]:
+            self.flush_blocks()
         
     def write_word(self, address, value):
-        self.memory[address] = value & 0xFF
-        self.memory[address + 1] = (value >> 8) & 0xFF
+        self._pack_word(self.memory, address, value & 0xFFFF)
         
     def update_flags(self, value):
         # Update Zero and Negative flags
-        self.registers['P'] &= 0x7D  # Clear Z and N flags
-        if value == 0:
-            self.registers['P'] |= 0x02  # Set Zero flag
-        if value & 0x80:
-            self.registers['P'] |= 0x80  # Set Negative flag
+        self.P = (self.P & 0x7D) | ZN_TABLE[value]
             
     # Instruction implementations
     def LDA_immediate(self):
         value = self.fetch_byte()
-        self.registers['A'] = value
+        self.A = value
         self.update_flags(value)
         return 2
         
     def LDA_absolute(self):
-        addr = self.fetch_byte() | (self.fetch_byte() << 8)
+        addr = self.fetch_word()
         value = self.read_byte(addr)
-        self.registers['A'] = value
+        self.A = value
         self.update_flags(value)
         return 4
         
     def STA_absolute(self):
-        addr = self.fetch_byte() | (self.fetch_byte() << 8)
-        self.write_byte(addr, self.registers['A'])
+        addr = self.fetch_word()
+        self.write_byte(addr, self.A)
         return 4
         
     def JMP_absolute(self):
-        addr = self.fetch_byte() | (self.fetch_byte() << 8)
-        self.registers['PC'] = addr
+        addr = self.fetch_word()
+        self.PC = addr
         return 3
         
     def NOP(self):
@@ -80,13 +222,124 @@ class CPU:
         self.running = False
         return 7
         
+    def _unknown(self):
+        return 0
+        
+    def apply_status(self, status):
+        # Replay side effects reported by the compiled loops
+        if status & STATUS_HALTED:
+            self.running = False
+        
+    def run_jit(self, target_cycles):
+        # Run up to target_cycles in the compiled loop, syncing registers
+        regs = self.regs
+        regs[:] = (self.A, self.X, self.Y, self.PC, self.SP, self.P)
+        cycles, status = run_cpu(self.mem_np, regs, target_cycles)
+        self.A, self.X, self.Y, self.PC, self.SP, self.P = regs.tolist()
+        self.clock_cycles += cycles
+        self.apply_status(status)
+        return cycles
+        
+    def run_native(self, target_cycles):
+        # Same as run_jit, but through the C core
+        regs = self.regs_c
+        regs[:] = (self.A, self.X, self.Y, self.PC, self.SP, self.P)
+        status = ctypes.c_uint8(0)
+        cycles = snes_run(self.memory_c, regs, target_cycles, ctypes.byref(status))
+        self.A, self.X, self.Y, self.PC, self.SP, self.P = regs
+        self.clock_cycles += cycles
+        self.apply_status(status.value)
+        return cycles
+        
+    def flush_blocks(self):
+        # Drop all translated blocks; call after patching code in memory
+        self.block_cache.clear()
+        self.code_map = bytearray(0x10000)
+        
+    def compile_block(self, start):
+        # Translate the straight-line run of instructions at start into one
+        # Python function, with operands baked in as constants
+        mem = self.memory
+        lines = []
+        pc = start
+        cycles = 0
+        result = None
+        for _ in range(MAX_BLOCK_INSTRUCTIONS):
+            opcode = mem[pc]
+            operand = mem[(pc + 1) & 0xFFFF]
+            addr = operand | (mem[(pc + 2) & 0xFFFF] << 8)
+            self.code_map[pc] = 1
+            if opcode in (0xAD, 0x8D, 0x4C):
+                self.code_map[(pc + 1) & 0xFFFF] = 1
+                self.code_map[(pc + 2) & 0xFFFF] = 1
+                next_pc = (pc + 3) & 0xFFFF
+            elif opcode == 0xA9:
+                self.code_map[(pc + 1) & 0xFFFF] = 1
+                next_pc = (pc + 2) & 0xFFFF
+            else:
+                next_pc = (pc + 1) & 0xFFFF
+                
+            if opcode == 0xA9:  # LDA immediate
+                lines.append(f"cpu.A = {operand}")
+                lines.append(f"cpu.P = (cpu.P & 0x7D) | {ZN_TABLE[operand]}")
+                cycles += 2
+            elif opcode == 0xAD:  # LDA absolute
+                lines.append(f"value = mem[{addr}]")
+                lines.append("cpu.A = value")
+                lines.append("cpu.P = (cpu.P & 0x7D) | ZN_TABLE[value]")
+                cycles += 4
+            elif opcode == 0x8D:  # STA absolute
+                cycles += 4
+                # A store into translated code flushes the cache; leave the
+                # block right away so the patched bytes are re-translated
+                lines.append(f"if code_map[{addr}]:")
+                lines.append(f"    cpu.write_byte({addr}, cpu.A)")
+                lines.append(f"    cpu.PC = {next_pc}")
+                lines.append(f"    cpu.clock_cycles += {cycles}")
+                lines.append(f"    return {cycles}")
+                lines.append(f"cpu.write_byte({addr}, cpu.A)")
+            elif opcode == 0x4C:  # JMP absolute
+                cycles += 3
+                pc = addr
+                break
+            elif opcode == 0xEA:  # NOP
+                cycles += 2
+            elif opcode == 0x00:  # BRK
+                lines.append("cpu.running = False")
+                cycles += 7
+                result = -cycles
+                pc = next_pc
+                break
+            else:  # Unknown opcode ends the block
+                pc = next_pc
+                break
+            pc = next_pc
+            
+        body = "\n    ".join(lines + [f"cpu.PC = {pc}", f"cpu.clock_cycles += {cycles}",
+                                  f"return {cycles if result is None else result}"])
+        src = f"def block(cpu):\n    mem = cpu.memory\n    code_map = cpu.code_map\n    {body}\n"
+        namespace = {"ZN_TABLE": ZN_TABLE}
+        exec(compile(src, f"<block ${start:04X}>", "exec"), namespace)
+        block = self.block_cache[start] = namespace["block"]
+        return block
+        
     def execute(self):
-        opcode = self.fetch_byte()
-        if opcode in self.opcodes:
-            cycles = self.opcodes[opcode]()
-            self.clock_cycles += cycles
-            return cycles
-        return 0  # Unknown opcode
+        # Run one translated block starting at PC. Returns the cycles taken,
+        # negated if the block ended in BRK
+        block = self.block_cache.get(self.PC)
+        if block is None:
+            block = self.compile_block(self.PC)
+        return block(self)
+        
+    def step(self):
+        # Run a single instruction through the handler table. This is the
+        # reference interpreter behind the debugger's Step command; execute,
+        # run_jit and run_native must match it
+        opcode = self.memory[self.PC]
+        self.PC = (self.PC + 1) & 0xFFFF
+        cycles = self.opcode_table[opcode]()
+        self.clock_cycles += cycles
+        return cycles
 
 class PPU:
     def __init__(self, canvas):
@@ -95,34 +348,71 @@ class PPU:
         self.height = 224
         self.canvas.config(width=self.width, height=self.height)
         self.vram = bytearray(0x8000)
+        self.vram_np = np.frombuffer(self.vram, dtype=np.uint8)
+        self.palette_lut = np.zeros((256, 3), dtype=np.uint8)
+        # Decoded RGB bitmaps of the 256 tiles, re-decoded only when stale
+        self.tile_cache = np.zeros((256, 8, 8, 3), dtype=np.uint8)
+        self.stale_tiles = np.ones(256, dtype=bool)
+        # Set whenever VRAM or the palette change. PPU registers
+        # ($2000-$2007) are not modelled, so CPU stores there don't count
+        self.dirty = True
         self.palette = [(0, 0, 0)] * 256
+        # Frame is rendered into an RGB buffer and uploaded to Tk in one go
+        self.framebuffer = bytearray(self.width * self.height * 3)
+        self.frame = np.frombuffer(self.framebuffer, dtype=np.uint8).reshape(self.height, self.width, 3)
+        self.image = tk.PhotoImage(width=self.width, height=self.height)
+        # Single persistent canvas item; frames only replace the image data
+        self.image_id = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.image)
+        self.ppm_header = b"P6\n%d %d\n255\n" % (self.width, self.height)
+        
+    @property
+    def palette(self):
+        return self._palette
+        
+    @palette.setter
+    def palette(self, colors):
+        # Convert once per palette change; render_frame only indexes the LUT
+        self._palette = list(colors)
+        self.palette_lut[:len(self._palette)] = self._palette
+        self.stale_tiles[:] = True
+        self.dirty = True
+        
+    def invalidate_tiles(self, start=0, end=0x1000):
+        # Mark cached tiles whose pattern bytes overlap vram[start:end]
+        self.stale_tiles[start // 16:(end + 15) // 16] = True
+        self.dirty = True
+        
+    def decode_tiles(self, indices):
+        # Gather each tile's 16 bytes, split the two bitplanes and combine
+        # them into 2-bit color indices, then map through the palette
+        tiles = self.vram_np[indices[:, None] * 16 + np.arange(16)]
+        bits0 = np.unpackbits(tiles[:, 0::2], axis=-1).reshape(-1, 8, 8)
+        bits1 = np.unpackbits(tiles[:, 1::2], axis=-1).reshape(-1, 8, 8)
+        return self.palette_lut[(bits1 << 1) | bits0]
         
     def render_frame(self):
-        self.canvas.delete("all")
-        # Render background tiles
-        for y in range(0, 28):
-            for x in range(0, 32):
-                tile_idx = self.vram[y * 32 + x]
-                self.render_tile(x * 8, y * 8, tile_idx)
-        
-    def render_tile(self, x, y, tile_idx):
-        tile_addr = tile_idx * 16
-        for ty in range(8):
-            plane0 = self.vram[tile_addr]
-            plane1 = self.vram[tile_addr + 1]
-            tile_addr += 2
-            
-            for tx in range(8):
-                bit = 7 - tx
-                color_idx = ((plane1 >> bit) & 1) << 1 | ((plane0 >> bit) & 1)
-                if color_idx > 0:
-                    color = self.palette[color_idx]
-                    hex_color = "#%02x%02x%02x" % color
-                    self.canvas.create_rectangle(
-                        x + tx, y + ty,
-                        x + tx + 1, y + ty + 1,
-                        fill=hex_color, outline=""
-                    )
+        if self.stale_tiles.any():
+            stale = np.flatnonzero(self.stale_tiles)
+            self.tile_cache[stale] = self.decode_tiles(stale)
+            self.stale_tiles[:] = False
+        # Stamp cached tiles for the whole 32x28 map in one gather
+        tilemap = self.vram_np[:32 * 28].reshape(28, 32)
+        tiles = self.tile_cache[tilemap]
+        # (tile_y, tile_x, row, col, rgb) -> (y, x, rgb)
+        self.frame[:] = tiles.transpose(0, 2, 1, 3, 4).reshape(self.height, self.width, 3)
+        self.blit()
+        self.dirty = False
+        
+    def blit(self):
+        # Upload the framebuffer to the canvas image as a binary PPM
+        ppm = self.ppm_header + bytes(self.framebuffer)
+        self.image.configure(data=base64.b64encode(ppm), format="PPM")
+        
+    def clear(self):
+        # Blank the screen; the next render_frame redraws from VRAM
+        self.frame[:] = 0
+        self.blit()
+        self.dirty = True
 
 class SNESEmulator:
     def __init__(self, root):
@@ -142,6 +432,7 @@ class SNESEmulator:
         emu_menu = tk.Menu(menubar, tearoff=0)
         emu_menu.add_command(label="Start", command=self.start)
         emu_menu.add_command(label="Pause", command=self.stop)
+        emu_menu.add_command(label="Step", command=self.step)
         emu_menu.add_command(label="Reset", command=self.reset_emulator)
         menubar.add_cascade(label="Emulation", menu=emu_menu)
 
@@ -176,26 +467,27 @@ class SNESEmulator:
         debug_frame = tk.LabelFrame(main_frame, text="CPU State")
         debug_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=5)
         
-        self.reg_vars = {}
-        for reg in ['A', 'X', 'Y', 'PC', 'SP', 'P']:
-            frame = tk.Frame(debug_frame)
-            frame.pack(fill=tk.X, padx=5, pady=2)
-            tk.Label(frame, text=f"{reg}:", width=4).pack(side=tk.LEFT)
-            var = tk.StringVar(value="0x0000")
-            self.reg_vars[reg] = var
-            tk.Label(frame, textvariable=var, width=8).pack(side=tk.LEFT)
+        # All registers share one label so a refresh is a single Tk call
+        self.debug_text = tk.StringVar()
+        tk.Label(debug_frame, textvariable=self.debug_text, font="TkFixedFont",
+                 justify=tk.LEFT, anchor=tk.NW).pack(fill=tk.X, padx=5, pady=2)
         
         # Status bar
         self.status = tk.Label(root, text="Ready", bd=1, relief=tk.SUNKEN, anchor=tk.W)
         self.status.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Initialize components
-        self.cpu = CPU()
         self.ppu = PPU(self.canvas)
+        self.cpu = CPU()
         self.running = False
         self.fps = 60
-        self.last_time = time.time()
+        self.frame_epoch_ns = time.perf_counter_ns()
+        self.frame_index = 0
+        self.debug_interval_ns = 100_000_000  # Refresh registers at ~10Hz
+        self.last_debug_ns = 0
         self.rom_data = None
+        self.cpu_state_win = None
+        self.cpu_state_text = None
         
         # Setup test environment
         self.setup_test_environment()
@@ -203,10 +495,7 @@ class SNESEmulator:
 
     def setup_test_environment(self):
         # Load test pattern into VRAM
-        for i in range(256):
-            # Create simple tile pattern
-            self.ppu.vram[i * 16] = 0xAA  # 10101010
-            self.ppu.vram[i * 16 + 1] = 0x55  # 01010101
+        self.ppu.vram[0:len(TEST_TILES)] = TEST_TILES
         
         # Setup palette
         self.ppu.palette = [
@@ -217,24 +506,11 @@ class SNESEmulator:
         ]
         
         # Create tile map
-        for y in range(28):
-            for x in range(32):
-                self.ppu.vram[0x1000 + y * 32 + x] = (x + y) % 256
-        
-        # Test program
-        program = [
-            0xA9, 0x01,        # LDA #$01
-            0x8D, 0x00, 0x20,   # STA $2000 (PPU Control)
-            0xA9, 0x3F,         # LDA #$3F
-            0x8D, 0x06, 0x20,   # STA $2006 (PPU Addr High)
-            0xA9, 0x00,         # LDA #$00
-            0x8D, 0x06, 0x20,   # STA $2006 (PPU Addr Low)
-            0x4C, 0x00, 0x80    # JMP $8000 (Loop)
-        ]
+        self.ppu.vram[0x1000:0x1000 + len(TEST_TILEMAP)] = TEST_TILEMAP
+        self.ppu.invalidate_tiles()
         
-        # Load program into memory
-        for i, byte in enumerate(program):
-            self.cpu.memory[0x8000 + i] = byte
+        # Load test program into memory
+        self.cpu.memory[0x8000:0x8000 + len(TEST_PROGRAM)] = TEST_PROGRAM
             
         # Set reset vector
         self.cpu.write_word(0xFFFC, 0x8000)
@@ -245,34 +521,68 @@ class SNESEmulator:
             
         # Run CPU for one frame
         target_cycles = 1364  # ~Cycles per frame at 60Hz
-        cycles = 0
-        while cycles < target_cycles and self.cpu.running:
-            cycles += self.cpu.execute()
+        cpu = self.cpu
+        if cpu.running:
+            if snes_run is not None:
+                cpu.run_native(target_cycles)
+            elif numba is not None:
+                cpu.run_jit(target_cycles)
+            else:
+                execute = cpu.execute
+                cycles = 0
+                while cycles < target_cycles:
+                    block_cycles = execute()
+                    if block_cycles < 0:
+                        break
+                    cycles += block_cycles
             
-        # Update PPU
-        self.ppu.render_frame()
-        self.update_debug_info()
-        
-        # Maintain FPS
-        current_time = time.time()
-        elapsed = current_time - self.last_time
-        delay = max(1, int((1/self.fps - elapsed) * 1000))
-        self.root.after(delay, self.run_frame)
-        self.last_time = current_time
+        # Update PPU, skipping frames where nothing it draws has changed
+        if self.ppu.dirty:
+            self.ppu.render_frame()
+        now_ns = time.perf_counter_ns()
+        if now_ns - self.last_debug_ns >= self.debug_interval_ns:
+            self.update_debug_info()
+            self.last_debug_ns = now_ns
+        
+        # Maintain FPS: schedule against fixed deadlines from the start
+        # epoch so per-frame jitter doesn't accumulate into drift
+        self.frame_index += 1
+        target_ns = self.frame_epoch_ns + self.frame_index * 1_000_000_000 // self.fps
+        now_ns = time.perf_counter_ns()
+        if now_ns - target_ns > 1_000_000_000 // self.fps:
+            # More than a frame behind (stall or slow host): re-anchor on
+            # now instead of bursting through the missed frames
+            self.frame_epoch_ns = target_ns = now_ns
+            self.frame_index = 0
+        delay_ms = max(0, (target_ns - now_ns) // 1_000_000)
+        self.root.after(delay_ms, self.run_frame)
         
     def start(self):
         if not self.running:
             self.running = True
             self.cpu.running = True
-            self.last_time = time.time()
+            self.frame_epoch_ns = time.perf_counter_ns()
+            self.frame_index = 0
             self.run_frame()
             self.status.config(text="Running")
         
     def stop(self):
         if self.running:
             self.running = False
+            self.update_debug_info()
             self.status.config(text="Paused")
             
+    def step(self):
+        # Execute a single instruction while paused, through the reference
+        # handlers rather than the translated blocks or compiled loops
+        if self.running or not self.cpu.running:
+            return
+        self.cpu.step()
+        if self.ppu.dirty:
+            self.ppu.render_frame()
+        self.update_debug_info()
+        self.status.config(text=f"Stepped to 0x{self.cpu.PC:04X}")
+            
     def reset_emulator(self):
         self.stop()
         self.cpu = CPU()
@@ -289,39 +599,49 @@ class SNESEmulator:
         self.stop()
         self.cpu = CPU()
         self.update_debug_info()
-        self.canvas.delete("all")
+        self.ppu.clear()
         self.status.config(text="ROM closed")
 
     def update_debug_info(self):
         # Update register display
-        self.reg_vars['A'].set(f"0x{self.cpu.registers['A']:02X}")
-        self.reg_vars['X'].set(f"0x{self.cpu.registers['X']:02X}")
-        self.reg_vars['Y'].set(f"0x{self.cpu.registers['Y']:02X}")
-        self.reg_vars['PC'].set(f"0x{self.cpu.registers['PC']:04X}")
-        self.reg_vars['SP'].set(f"0x{self.cpu.registers['SP']:04X}")
-        self.reg_vars['P'].set(f"0x{self.cpu.registers['P']:02X}")
+        cpu = self.cpu
+        self.debug_text.set(
+            f"A:  0x{cpu.A:02X}\n"
+            f"X:  0x{cpu.X:02X}\n"
+            f"Y:  0x{cpu.Y:02X}\n"
+            f"PC: 0x{cpu.PC:04X}\n"
+            f"SP: 0x{cpu.SP:04X}\n"
+            f"P:  0x{cpu.P:02X}"
+        )
         
     def show_cpu_state(self):
-        # Simple CPU state viewer
-        cpu_win = tk.Toplevel(self.root)
-        cpu_win.title("CPU State")
-        
-        text = tk.Text(cpu_win, width=60, height=20)
-        text.pack(padx=10, pady=10)
+        # Simple CPU state viewer, created on first use and then reused
+        if self.cpu_state_win is None:
+            self.cpu_state_win = tk.Toplevel(self.root)
+            self.cpu_state_win.title("CPU State")
+            self.cpu_state_win.protocol("WM_DELETE_WINDOW", self.cpu_state_win.withdraw)
+            self.cpu_state_text = tk.Text(self.cpu_state_win, width=60, height=20)
+            self.cpu_state_text.pack(padx=10, pady=10)
+        else:
+            self.cpu_state_win.deiconify()
+            self.cpu_state_win.lift()
         
         # Display registers
-        text.insert(tk.END, "Registers:\n")
+        lines = ["Registers:"]
         for reg, value in self.cpu.registers.items():
-            text.insert(tk.END, f"  {reg}: 0x{value:04X}\n")
+            lines.append(f"  {reg}: 0x{value:04X}")
         
         # Display disassembly around PC
-        text.insert(tk.END, "\nDisassembly:\n")
-        pc = self.cpu.registers['PC']
+        lines.append("")
+        lines.append("Disassembly:")
+        pc = self.cpu.PC
         for offset in range(-5, 6):
             addr = pc + offset
             if 0 <= addr < 0x10000:
                 opcode = self.cpu.memory[addr]
-                text.insert(tk.END, f"{'>' if offset == 0 else ' '} 0x{addr:04X}: 0x{opcode:02X}\n")
+                lines.append(f"{'>' if offset == 0 else ' '} 0x{addr:04X}: 0x{opcode:02X}")
+        
+        self.cpu_state_text.replace("1.0", tk.END, "\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     root = tk.Tk()
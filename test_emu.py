@@ -0,0 +1,56 @@
+import unittest
+
+import emu
+
+
+def make_cpu(program, start=0x8000):
+    cpu = emu.CPU()
+    cpu.memory[start:start + len(program)] = bytes(program)
+    cpu.PC = start
+    return cpu
+
+
+class BlockTranslationTest(unittest.TestCase):
+    def run_blocks(self, cpu, limit=100):
+        for _ in range(limit):
+            if cpu.execute() < 0:
+                break
+
+    def run_steps(self, cpu, limit=100):
+        for _ in range(limit):
+            if not cpu.running:
+                break
+            cpu.step()
+
+    def test_store_into_next_instruction_operand(self):
+        # STA $8006 overwrites the operand of the following LDA #$00
+        program = [0xA9, 0x77, 0x8D, 0x06, 0x80, 0xA9, 0x00, 0x00]
+        blocks = make_cpu(program)
+        steps = make_cpu(program)
+        self.run_blocks(blocks)
+        self.run_steps(steps)
+        self.assertEqual(steps.A, 0x77)
+        self.assertEqual(steps.P, 0x00)
+        self.assertEqual(blocks.registers, steps.registers)
+        self.assertEqual(blocks.clock_cycles, steps.clock_cycles)
+        self.assertFalse(blocks.running)
+
+    def test_store_outside_code_keeps_block(self):
+        program = [0xA9, 0x42, 0x8D, 0x00, 0x30, 0x4C, 0x00, 0x80]
+        cpu = make_cpu(program)
+        cycles = cpu.execute()
+        self.assertEqual(cycles, 9)
+        self.assertEqual(cpu.memory[0x3000], 0x42)
+        self.assertEqual(cpu.PC, 0x8000)
+        self.assertIn(0x8000, cpu.block_cache)
+
+
+class MemoryTest(unittest.TestCase):
+    def test_write_byte_masks_to_8_bits(self):
+        cpu = emu.CPU()
+        cpu.write_byte(0x10, 0x1FF)
+        self.assertEqual(cpu.memory[0x10], 0xFF)
+
+
+if __name__ == "__main__":
+    unittest.main()